@@ -5,18 +5,32 @@
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any, Tuple, Optional
 
-from docx import Document
-from docx.shared import Pt
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-
+from youtube_transcript_generator.docx_writer import ALIGN_CENTER, ALIGN_JUSTIFY, heading, paragraph, paragraph_xml, write_docx
 from youtube_transcript_generator.downloader import clean_filename
 from youtube_transcript_generator.transcriber import format_time
 from youtube_transcript_generator.translator import translate_text, translate_paragraphs, detect_language, TranslationError
 
 
+# 스크립트 정리에 사용하는 정규식 (import 시 한 번만 컴파일)
+MUSIC_TAG_PATTERN = re.compile(r'\[음악\]')
+REPEATED_DOTS_PATTERN = re.compile(r'\.+')
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+# 문단을 나누는 기준이 되는 키워드
+PARAGRAPH_KEYWORDS = ('그리고', '따라서', '그러나', '그래서', '결론적으로')
+PARAGRAPH_BREAK_PATTERN = re.compile('|'.join(map(re.escape, PARAGRAPH_KEYWORDS)))
+
+# 언어 감지에 사용할 스크립트 앞부분 길이 (문자 수)
+LANGUAGE_SAMPLE_SIZE = 4000
+
+# .docx를 python-docx로 저장할지 여부 (기본값: docx_writer로 직접 저장)
+USE_PYTHON_DOCX = os.environ.get("USE_PYTHON_DOCX", "").lower() in ("1", "true", "yes")
+
+
 def create_transcript_document(
     captions: List[Dict[str, Any]], 
     title: str, 
@@ -25,69 +39,146 @@ def create_transcript_document(
     api_key: Optional[str] = None
 ) -> str:
     """자막을 문서 파일로 만들기."""
-    # 타임스탬프 포함 자막과 전체 스크립트 문서를 각각 생성
-    timestamp_file = create_timestamp_document(captions, title, output_dir)
-    script_file = create_script_document(captions, title, output_dir, translate, api_key)
+    # 두 문서가 같은 생성 시간과 파일 이름을 사용하도록 한 번만 계산
+    created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    safe_title = clean_filename(title)
+    
+    # 타임스탬프 포함 자막과 전체 스크립트 문서를 서로 독립적이므로 동시에 생성
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        timestamp_future = executor.submit(
+            create_timestamp_document, captions, title, output_dir, created_at, safe_title
+        )
+        script_future = executor.submit(
+            create_script_document, captions, title, output_dir, translate, api_key, created_at, safe_title
+        )
+        timestamp_file = timestamp_future.result()
+        script_file = script_future.result()
     
     # 타임스탬프 파일 경로 반환
     return timestamp_file
 
 
+def add_plain_paragraphs(doc: Any, lines: List[str]) -> None:
+    """서식 없는 문단 여러 개를 한 번의 XML 파싱으로 문서 끝에 추가.
+    
+    줄마다 doc.add_paragraph()를 호출하는 것과 같은 결과지만, 자막이 수천 줄인 경우에도 빠릅니다.
+    """
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+    
+    paragraphs_xml = "".join(paragraph_xml(paragraph(line)) for line in lines)
+    container = parse_xml(f"<w:body {nsdecls('w')}>{paragraphs_xml}</w:body>")
+    
+    # 구역 설정(sectPr)은 본문의 마지막 요소여야 하므로 그 앞에 삽입
+    body = doc.element.body
+    sect_pr = body.sectPr
+    for element in list(container):
+        if sect_pr is not None:
+            sect_pr.addprevious(element)
+        else:
+            body.append(element)
+
+
+def save_docx(output_file: str, blocks: List[Dict[str, Any]]) -> None:
+    """문단 블록 목록을 .docx 파일로 저장."""
+    if USE_PYTHON_DOCX:
+        save_docx_with_python_docx(output_file, blocks)
+    else:
+        write_docx(output_file, blocks)
+
+
+def save_docx_with_python_docx(output_file: str, blocks: List[Dict[str, Any]]) -> None:
+    """문단 블록 목록을 python-docx로 저장 (USE_PYTHON_DOCX 설정 시 사용)."""
+    # python-docx는 이 경로에서만 필요하므로 여기서 가져옴
+    from docx import Document
+    from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+    
+    alignments = {
+        ALIGN_CENTER: WD_PARAGRAPH_ALIGNMENT.CENTER,
+        ALIGN_JUSTIFY: WD_PARAGRAPH_ALIGNMENT.JUSTIFY,
+    }
+    doc = Document()
+    
+    # 서식 없는 한 줄짜리 문단이 연속되면 모아서 한 번에 추가
+    plain_lines = []
+    for block in blocks:
+        text = block["text"]
+        if (text and "\n" not in text and not block["level"]
+                and not block["alignment"] and not block["bold"]):
+            plain_lines.append(text)
+            continue
+        
+        if plain_lines:
+            add_plain_paragraphs(doc, plain_lines)
+            plain_lines = []
+        
+        if block["level"]:
+            para = doc.add_heading(text, level=block["level"])
+        else:
+            para = doc.add_paragraph(text)
+        if block["alignment"]:
+            para.alignment = alignments[block["alignment"]]
+        if block["bold"]:
+            for run in para.runs:
+                run.bold = True
+    
+    if plain_lines:
+        add_plain_paragraphs(doc, plain_lines)
+    
+    doc.save(output_file)
+
+
 def create_timestamp_document(
     captions: List[Dict[str, Any]], 
     title: str, 
-    output_dir: str
+    output_dir: str,
+    created_at: Optional[str] = None,
+    safe_title: Optional[str] = None
 ) -> str:
     """타임스탬프가 포함된 자막 문서 생성."""
-    doc = Document()
-    
-    # 제목 추가
-    title_para = doc.add_heading(title, level=1)
-    title_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-    
-    # 생성 시간 추가
-    time_para = doc.add_paragraph(f"생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    time_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-    doc.add_paragraph()
-    
-    # 타임스탬프 포함 자막 섹션 추가
-    doc.add_heading("타임스탬프 포함 자막", level=2)
-    
-    # 자막 내용 추가
-    full_text = ""
-    if captions:
-        for caption in captions:
-            time_str = format_time(caption['start'])
-            text = caption['text']
-            doc.add_paragraph(f"[{time_str}] {text}")
-            full_text += text + " "
+    if created_at is None:
+        created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    if safe_title is None:
+        safe_title = clean_filename(title)
+    
+    blocks = [
+        # 제목 추가
+        heading(title, level=1, alignment=ALIGN_CENTER),
+        # 생성 시간 추가
+        paragraph(f"생성 시간: {created_at}", alignment=ALIGN_CENTER),
+        paragraph(),
+        # 타임스탬프 포함 자막 섹션 추가
+        heading("타임스탬프 포함 자막", level=2),
+    ]
+    
+    # 자막 내용 추가 (타임스탬프 줄은 docx와 txt에서 함께 사용)
+    full_text = " ".join(caption['text'] for caption in captions) if captions else ""
+    caption_lines = [f"[{format_time(caption['start'])}] {caption['text']}" for caption in captions] if captions else []
+    if caption_lines:
+        blocks.extend(paragraph(line) for line in caption_lines)
     else:
-        doc.add_paragraph("자막이 없습니다.")
+        blocks.append(paragraph("자막이 없습니다."))
     
     # 자막이 거의 없는 경우 처리
     if not captions or len(full_text.strip()) < 30:
-        warning_para = doc.add_paragraph("※ 이 동영상에는 충분한 자막이 없습니다.")
-        warning_para.runs[0].bold = True
+        blocks.append(paragraph("※ 이 동영상에는 충분한 자막이 없습니다.", bold=True))
     
     # 파일 저장
-    safe_title = clean_filename(title)
     output_file = os.path.join(output_dir, f"{safe_title}_타임스탬프.docx")
-    doc.save(output_file)
+    save_docx(output_file, blocks)
     
     # 텍스트 파일로도 저장
     txt_output_file = os.path.join(output_dir, f"{safe_title}_타임스탬프.txt")
     with open(txt_output_file, 'w', encoding='utf-8') as f:
         f.write(f"{title}\n\n")
-        f.write(f"생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        f.write(f"생성 시간: {created_at}\n\n")
         
         if not captions or len(full_text.strip()) < 30:
             f.write("※ 이 동영상에는 충분한 자막이 없습니다.\n\n")
         
         f.write("==== 타임스탬프 포함 자막 ====\n\n")
-        if captions:
-            for caption in captions:
-                time_str = format_time(caption['start'])
-                f.write(f"[{time_str}] {caption['text']}\n")
+        if caption_lines:
+            f.write("\n".join(caption_lines) + "\n")
         else:
             f.write("자막이 없습니다.\n")
     
@@ -99,41 +190,41 @@ def create_script_document(
     title: str, 
     output_dir: str,
     translate: bool = False,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    created_at: Optional[str] = None,
+    safe_title: Optional[str] = None
 ) -> str:
     """전체 스크립트 문서 생성 (문단 정리 포함)."""
-    doc = Document()
-    
-    # 제목 추가
-    title_para = doc.add_heading(title, level=1)
-    title_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-    
-    # 생성 시간 추가
-    time_para = doc.add_paragraph(f"생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    time_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-    doc.add_paragraph()
-    
-    # 자막 텍스트 추출
-    full_text = ""
-    if captions:
-        for caption in captions:
-            full_text += caption['text'] + " "
+    if created_at is None:
+        created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    if safe_title is None:
+        safe_title = clean_filename(title)
+    
+    blocks = [
+        # 제목 추가
+        heading(title, level=1, alignment=ALIGN_CENTER),
+        # 생성 시간 추가
+        paragraph(f"생성 시간: {created_at}", alignment=ALIGN_CENTER),
+        paragraph(),
+    ]
+    
+    # 자막 텍스트 추출 (끝의 공백은 refine_script가 마지막 문장도 '. '로 나누도록 유지)
+    full_text = " ".join(caption['text'] for caption in captions) + " " if captions else ""
     
     # 자막이 거의 없는 경우 처리
     if not captions or len(full_text.strip()) < 30:
-        warning_para = doc.add_paragraph("※ 이 동영상에는 충분한 자막이 없습니다.")
-        warning_para.runs[0].bold = True
+        blocks.append(paragraph("※ 이 동영상에는 충분한 자막이 없습니다.", bold=True))
         full_text = "※ 이 동영상에는 충분한 자막이 없습니다. 자동 생성된 자막이 제한적이거나 없는 경우입니다."
     
+    # 언어 감지 (번역할 때만, 앞부분만으로도 충분히 판별 가능)
+    source_lang = detect_language(full_text[:LANGUAGE_SAMPLE_SIZE]) if translate else None
+    
     # 전체 스크립트 정제
     refined_script = refine_script(full_text) if full_text.strip() else "자막이 없습니다."
     
     # # 문단별로 정리
     # paragraphs = split_into_paragraphs(full_text)
     
-    # 언어 감지
-    source_lang = detect_language(refined_script)
-    
     # 번역이 필요한 경우 (언어가 한국어가 아닌 경우에만)
     translated_script = None
     translated_paragraphs = None
@@ -153,15 +244,13 @@ def create_script_document(
             translated_paragraphs = None
     
     # 전체 스크립트 추가 (정제된 버전)
-    doc.add_heading("전체 스크립트", level=2)
-    full_script_para = doc.add_paragraph(refined_script)
-    full_script_para.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
+    blocks.append(heading("전체 스크립트", level=2))
+    blocks.append(paragraph(refined_script, alignment=ALIGN_JUSTIFY))
     
     # 번역된 스크립트가 있으면 추가
     if translated_script:
-        doc.add_heading("번역된 전체 스크립트 (한국어)", level=2)
-        trans_para = doc.add_paragraph(translated_script)
-        trans_para.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
+        blocks.append(heading("번역된 전체 스크립트 (한국어)", level=2))
+        blocks.append(paragraph(translated_script, alignment=ALIGN_JUSTIFY))
     
     # # 문단별로 정리된 버전 추가
     # doc.add_heading("문단별 정리 스크립트", level=2)
@@ -186,15 +275,14 @@ def create_script_document(
     #     doc.add_paragraph("자막이 없거나 문단 분리가 불가능합니다.")
     
     # 파일 저장
-    safe_title = clean_filename(title)
     output_file = os.path.join(output_dir, f"{safe_title}_전체스크립트.docx")
-    doc.save(output_file)
+    save_docx(output_file, blocks)
     
     # 텍스트 파일로도 저장
     txt_output_file = os.path.join(output_dir, f"{safe_title}_전체스크립트.txt")
     with open(txt_output_file, 'w', encoding='utf-8') as f:
         f.write(f"{title}\n\n")
-        f.write(f"생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        f.write(f"생성 시간: {created_at}\n\n")
         
         if not captions or len(full_text.strip()) < 30:
             f.write("※ 이 동영상에는 충분한 자막이 없습니다.\n\n")
@@ -226,20 +314,22 @@ def create_script_document(
 def refine_script(text: str) -> str:
     """전체 스크립트에서 중복되는 단어나 불필요한 표현을 정리."""
     # '[음악]' 같은 불필요한 표현 제거
-    text = re.sub(r'\[음악\]', '', text)
+    text = MUSIC_TAG_PATTERN.sub('', text)
     
     # 같은 문장이 반복되는 경우 한 번만 표시
     sentences = text.split('. ')
+    seen = set()
     unique_sentences = []
     for sentence in sentences:
-        if sentence and sentence not in unique_sentences:
+        if sentence and sentence not in seen:
+            seen.add(sentence)
             unique_sentences.append(sentence)
     
     # 정리된 스크립트 반환
     refined_text = '. '.join(unique_sentences)
     
     # 마침표가 연속으로 나오는 경우 하나로 수정
-    refined_text = re.sub(r'\.+', '.', refined_text)
+    refined_text = REPEATED_DOTS_PATTERN.sub('.', refined_text)
     
     # 앞뒤 공백 제거
     refined_text = refined_text.strip()
@@ -253,10 +343,10 @@ def split_into_paragraphs(text: str) -> List[str]:
         return []
     
     # 불필요한 표현 제거
-    text = re.sub(r'\[음악\]', '', text)
+    text = MUSIC_TAG_PATTERN.sub('', text)
     
     # 문장 분리 (마침표, 느낌표, 물음표 뒤 공백으로 구분)
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = SENTENCE_BOUNDARY_PATTERN.split(text)
     
     # 문단 분리 (4-5개 문장을 하나의 문단으로)
     paragraphs = []
@@ -267,7 +357,7 @@ def split_into_paragraphs(text: str) -> List[str]:
             
             # 문단 분리 조건: 문장 길이가 5 이상이거나 특정 키워드로 끝나는 경우
             if (len(current_paragraph) >= 5 or 
-                any(keyword in sentence.lower() for keyword in ['그리고', '따라서', '그러나', '그래서', '결론적으로'])):
+                PARAGRAPH_BREAK_PATTERN.search(sentence)):
                 paragraphs.append(' '.join(current_paragraph))
                 current_paragraph = []
     
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""python-docx 없이 .docx 파일을 직접 생성하는 모듈.
+
+이 프로젝트의 문서는 제목과 본문 문단으로만 이루어지므로, 고정된 패키지 구성 요소와
+문자열로 만든 document.xml을 ZIP 파일로 바로 저장합니다.
+"""
+
+import re
+import zipfile
+from typing import Any, Dict, Iterable, Optional
+from xml.sax.saxutils import escape
+
+
+# 문단 정렬 값 (w:jc)
+ALIGN_CENTER = "center"
+ALIGN_JUSTIFY = "both"
+
+# XML 1.0에서 허용되지 않는 제어 문자
+INVALID_XML_CHARS_PATTERN = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+# ZIP 압축 수준 (문서 크기보다 생성 속도를 우선해 가장 빠른 수준 사용)
+COMPRESS_LEVEL = 1
+
+WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '</Types>'
+)
+
+PACKAGE_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+DOCUMENT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+# python-docx 기본 템플릿의 기본값과 Normal, Heading 1, Heading 2 스타일을 옮긴 것
+# 테마 파트는 포함하지 않으므로 테마 글꼴 대신 그 테마가 지정하는 글꼴을 직접 지정
+# (본문 Cambria, 제목 Calibri, 한글 맑은 고딕)
+STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:styles xmlns:w="{WORD_NAMESPACE}">'
+    '<w:docDefaults><w:rPrDefault><w:rPr>'
+    '<w:rFonts w:ascii="Cambria" w:eastAsia="맑은 고딕" w:hAnsi="Cambria" w:cs="Times New Roman"/>'
+    '<w:sz w:val="22"/><w:szCs w:val="22"/><w:lang w:val="en-US" w:eastAsia="ko-KR" w:bidi="ar-SA"/>'
+    '</w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:spacing w:after="200" w:line="276" w:lineRule="auto"/></w:pPr></w:pPrDefault>'
+    '</w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal">'
+    '<w:name w:val="Normal"/><w:qFormat/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1">'
+    '<w:name w:val="heading 1"/><w:basedOn w:val="Normal"/><w:next w:val="Normal"/><w:qFormat/>'
+    '<w:pPr><w:keepNext/><w:keepLines/><w:spacing w:before="480" w:after="0"/><w:outlineLvl w:val="0"/></w:pPr>'
+    '<w:rPr><w:rFonts w:ascii="Calibri" w:eastAsia="맑은 고딕" w:hAnsi="Calibri" w:cs="Times New Roman"/>'
+    '<w:b/><w:bCs/><w:color w:val="365F91"/><w:sz w:val="28"/><w:szCs w:val="28"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading2">'
+    '<w:name w:val="heading 2"/><w:basedOn w:val="Normal"/><w:next w:val="Normal"/><w:qFormat/>'
+    '<w:pPr><w:keepNext/><w:keepLines/><w:spacing w:before="200" w:after="0"/><w:outlineLvl w:val="1"/></w:pPr>'
+    '<w:rPr><w:rFonts w:ascii="Calibri" w:eastAsia="맑은 고딕" w:hAnsi="Calibri" w:cs="Times New Roman"/>'
+    '<w:b/><w:bCs/><w:color w:val="4F81BD"/><w:sz w:val="26"/><w:szCs w:val="26"/></w:rPr></w:style>'
+    '</w:styles>'
+)
+
+DOCUMENT_HEADER_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:document xmlns:w="{WORD_NAMESPACE}"><w:body>'
+)
+
+# 용지 크기(Letter)와 여백은 python-docx 기본 템플릿과 동일
+DOCUMENT_FOOTER_XML = (
+    '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="1440" w:right="1800" w:bottom="1440" w:left="1800" '
+    'w:header="720" w:footer="720" w:gutter="0"/></w:sectPr>'
+    '</w:body></w:document>'
+)
+
+
+def heading(text: str, level: int = 1, alignment: Optional[str] = None) -> Dict[str, Any]:
+    """제목 문단 블록 생성."""
+    return {"text": text, "level": level, "alignment": alignment, "bold": False}
+
+
+def paragraph(text: str = "", alignment: Optional[str] = None, bold: bool = False) -> Dict[str, Any]:
+    """본문 문단 블록 생성."""
+    return {"text": text, "level": 0, "alignment": alignment, "bold": bold}
+
+
+def paragraph_xml(block: Dict[str, Any]) -> str:
+    """문단 블록을 <w:p> XML 문자열로 변환."""
+    properties = ""
+    if block["level"]:
+        properties += f'<w:pStyle w:val="Heading{block["level"]}"/>'
+    if block["alignment"]:
+        properties += f'<w:jc w:val="{block["alignment"]}"/>'
+    paragraph_properties = f"<w:pPr>{properties}</w:pPr>" if properties else ""
+    
+    text = block["text"]
+    if not text:
+        return f"<w:p>{paragraph_properties}</w:p>"
+    
+    # 줄바꿈은 python-docx와 마찬가지로 <w:br/>로 변환
+    text = INVALID_XML_CHARS_PATTERN.sub("", text)
+    text_xml = "<w:br/>".join(
+        f'<w:t xml:space="preserve">{escape(line)}</w:t>' for line in text.split("\n")
+    )
+    run_properties = "<w:rPr><w:b/></w:rPr>" if block["bold"] else ""
+    
+    return f"<w:p>{paragraph_properties}<w:r>{run_properties}{text_xml}</w:r></w:p>"
+
+
+def write_docx(path: str, blocks: Iterable[Dict[str, Any]]) -> None:
+    """문단 블록 목록을 .docx 파일로 저장."""
+    body_xml = "".join(paragraph_xml(block) for block in blocks)
+    
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL) as docx_file:
+        docx_file.writestr("[Content_Types].xml", CONTENT_TYPES_XML)
+        docx_file.writestr("_rels/.rels", PACKAGE_RELS_XML)
+        docx_file.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS_XML)
+        docx_file.writestr("word/styles.xml", STYLES_XML)
+        docx_file.writestr("word/document.xml", DOCUMENT_HEADER_XML + body_xml + DOCUMENT_FOOTER_XML)
\ No newline at end of file
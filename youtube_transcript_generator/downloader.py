@@ -3,18 +3,24 @@
 
 """유튜브 동영상 다운로드 모듈."""
 
+import glob
 import os
 import re
-from typing import Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
 
-import yt_dlp
 
+# 파일 이름에 사용할 수 없는 문자
+INVALID_FILENAME_CHARS_PATTERN = re.compile(r'[\\/*?:"<>|]')
 
+
+@lru_cache(maxsize=128)
 def clean_filename(filename: str) -> str:
     """파일 이름에서 유효하지 않은 문자 제거."""
-    return re.sub(r'[\\/*?:"<>|]', "", filename)
+    return INVALID_FILENAME_CHARS_PATTERN.sub("", filename)
 
 
+@lru_cache(maxsize=128)
 def get_video_id(url: str) -> str:
     """YouTube URL에서 비디오 ID 추출."""
     if "youtu.be" in url:
@@ -25,8 +31,31 @@ def get_video_id(url: str) -> str:
     return url  # 이미 ID인 경우
 
 
+def get_video_title(url: str) -> Optional[str]:
+    """동영상을 다운로드하지 않고 제목만 가져오기."""
+    ydl_opts = {
+        'quiet': True,
+        'no_warnings': True,
+        'skip_download': True,
+        'ignoreerrors': True,
+    }
+    
+    try:
+        import yt_dlp
+        
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+    except Exception as e:
+        print(f"동영상 제목 추출 실패 (기본 ID를 사용합니다): {str(e)}")
+        return None
+    
+    return info.get('title') if info else None
+
+
 def download_video(url: str, output_dir: str) -> Tuple[str, str, str]:
     """유튜브 동영상 다운로드."""
+    import yt_dlp
+    
     video_id = get_video_id(url)
     
     ydl_opts = {
@@ -42,11 +71,15 @@ def download_video(url: str, output_dir: str) -> Tuple[str, str, str]:
         filename = ydl.prepare_filename(info)
         title = info.get('title', video_id)
         
-    # 확장자가 변경될 수 있으므로 실제 파일 확인
-    base_filename = os.path.join(output_dir, video_id)
-    for file in os.listdir(output_dir):
-        if file.startswith(video_id + '.'):
-            filename = os.path.join(output_dir, file)
-            break
+    # 확장자가 변경될 수 있으므로 yt_dlp가 알려주는 실제 파일 경로 사용
+    requested_downloads = info.get('requested_downloads') or [{}]
+    downloaded_file = requested_downloads[0].get('filepath')
+    if downloaded_file and os.path.exists(downloaded_file):
+        filename = downloaded_file
+    else:
+        # 경로 정보가 없으면 디렉토리 전체를 보지 않고 비디오 ID 파일만 찾기
+        matches = glob.glob(os.path.join(glob.escape(output_dir), f"{glob.escape(video_id)}.*"))
+        if matches:
+            filename = matches[0]
     
     return filename, title, video_id
\ No newline at end of file
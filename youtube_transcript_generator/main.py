@@ -6,10 +6,11 @@
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from pathlib import Path
 
-from youtube_transcript_generator.downloader import download_video, get_video_id
+from youtube_transcript_generator.downloader import download_video, get_video_id, get_video_title
 from youtube_transcript_generator.transcriber import get_youtube_captions
 from youtube_transcript_generator.document_generator import create_transcript_document
 from youtube_transcript_generator.translator import load_env_file
@@ -35,9 +36,6 @@ def process_video(
         video_id = get_video_id(url)
         print(f"비디오 ID: {video_id}")
         
-        # 유튜브 자막 가져오기 시도
-        success, captions = get_youtube_captions(video_id)
-        
         # 다운로드 시도 여부 확인 (선택 사항)
         try_download = False  # 동영상 다운로드를 건너뛰려면 False로 설정
         
@@ -46,6 +44,9 @@ def process_video(
         
         # 동영상 정보 가져오기 (다운로드 없이)
         if try_download:
+            # 유튜브 자막 가져오기 시도
+            success, captions = get_youtube_captions(video_id)
+            
             try:
                 print(f"동영상 다운로드 중: {url}")
                 audio_file, video_title, _ = download_video(url, output_dir)
@@ -54,22 +55,16 @@ def process_video(
             except Exception as e:
                 print(f"동영상 다운로드 실패 (자막만 처리합니다): {str(e)}")
         else:
-            # 동영상 다운로드 없이 제목만 가져오기 (YouTube API 사용)
-            try:
-                import yt_dlp
-                ydl_opts = {
-                    'quiet': True,
-                    'no_warnings': True,
-                    'skip_download': True,
-                    'ignoreerrors': True,
-                }
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    if info:
-                        title = info.get('title', title)
+            # 자막과 제목(YouTube API 사용)은 서로 독립적인 요청이므로 동시에 가져오기
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                captions_future = executor.submit(get_youtube_captions, video_id)
+                title_future = executor.submit(get_video_title, url)
+                success, captions = captions_future.result()
+                video_title = title_future.result()
+            
+            if video_title:
+                title = video_title
                 print(f"동영상 제목 추출 완료: {title}")
-            except Exception as e:
-                print(f"동영상 제목 추출 실패 (기본 ID를 사용합니다): {str(e)}")
         
         # 유튜브 자막이 없는 경우 메시지 표시
         if not success or not captions:
@@ -58,19 +58,21 @@ def check_meaningful_captions(captions: List[Dict[str, Any]]) -> bool:
     if not captions:
         return False
     
-    # 자막 텍스트의 총 길이 확인
-    total_text = " ".join(caption["text"] for caption in captions)
+    # 특수문자, 공백 등을 제외한 실질적인 문자 수를 세다가
+    # 의미 있는 텍스트가 20자 이상이 되면 바로 종료
+    meaningful_length = 0
+    for caption in captions:
+        for c in caption["text"]:
+            if c.isalnum():
+                meaningful_length += 1
+                if meaningful_length >= 20:
+                    return True
     
-    # 특수문자, 공백 등을 제외한 실질적인 텍스트 길이
-    meaningful_length = len("".join(c for c in total_text if c.isalnum()))
-    
-    # 의미 있는 텍스트가 최소 20자 이상인지 확인
-    return meaningful_length >= 20
+    return False
 
 
 def format_time(seconds: float) -> str:
     """초를 00:00:00 형식으로 변환."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    seconds = int(seconds % 60)
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
\ No newline at end of file
@@ -4,8 +4,10 @@
 """스크립트 번역 모듈."""
 
 import os
+import re
 import time
-from typing import Optional, Dict, Any
+from collections import Counter
+from typing import Optional, Dict, Any, List, Tuple
 import json
 from pathlib import Path
 
@@ -15,11 +17,49 @@ try:
 except ImportError:
     dotenv_loaded = False
 
-try:
-    import google.generativeai as genai
-    from google.generativeai.types import HarmCategory, HarmBlockThreshold
-except ImportError:
-    genai = None
+# google-generativeai는 import 비용이 크므로 번역할 때 처음 한 번만 가져옴 (import_genai 참고)
+genai = None
+
+
+# 번역에 사용할 Gemini 모델 및 설정
+MODEL_NAME = "gemini-1.5-pro"
+
+GENERATION_CONFIG = {
+    "temperature": 0.2,
+    "top_p": 0.8,
+    "top_k": 40,
+    "max_output_tokens": 8192,
+}
+
+# 설정이 끝난 API 키와 생성된 모델 캐시 (호출마다 다시 설정하지 않도록)
+_GENAI_API_KEY: Optional[str] = None
+_MODEL_CACHE: Dict[Any, Any] = {}
+
+# 단락 일괄 번역 시 각 단락 앞에 붙이는 구분 마커
+SEGMENT_MARKER = "<<<SEG {index}>>>"
+SEGMENT_PATTERN = re.compile(r"<<<SEG (\d+)>>>")
+
+# 한 번의 요청에 담을 최대 토큰 수 (대략적인 추정치)
+BATCH_TOKEN_BUDGET = 6000
+
+# 언어 감지용 문자 범위와 태그 (str.translate 변환표는 import 시 한 번만 생성)
+LANGUAGE_RANGES = {
+    'ko': [range(0xAC00, 0xD7A4)],  # 한글 음절
+    'ja': [range(0x3040, 0x30FF)],  # 히라가나, 가타카나
+    'zh': [range(0x4E00, 0x9FFF)],  # 중국어 간체, 번체 (일부)
+    'en': [range(ord('A'), ord('Z') + 1), range(ord('a'), ord('z') + 1)],
+}
+LANGUAGE_TAGS = {'ko': 'k', 'ja': 'j', 'zh': 'z', 'en': 'e'}
+LANGUAGE_TABLE = {
+    code: LANGUAGE_TAGS[lang]
+    for lang, ranges in LANGUAGE_RANGES.items()
+    for char_range in ranges
+    for code in char_range
+}
+
+# 언어 감지 시 한 번에 집계할 문자 수와 조기 종료 기준 (한 언어의 문자 비율)
+LANGUAGE_CHUNK_SIZE = 512
+LANGUAGE_DOMINANCE_RATIO = 0.6
 
 
 class TranslationError(Exception):
@@ -49,12 +89,43 @@ def load_env_file(env_path: Optional[str] = None) -> bool:
         return False
 
 
-def configure_genai(api_key: Optional[str] = None) -> bool:
-    """Gemini API 설정."""
+def import_genai() -> bool:
+    """google-generativeai 패키지를 처음 사용할 때 가져오기."""
+    global genai
+    
     if genai is None:
+        try:
+            import google.generativeai as genai_module
+        except ImportError:
+            return False
+        genai = genai_module
+    
+    return True
+
+
+def get_safety_settings() -> Dict[Any, Any]:
+    """번역에 사용할 안전 설정 (모든 차단 해제)."""
+    from google.generativeai.types import HarmCategory, HarmBlockThreshold
+    
+    return {
+        HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+        HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+    }
+
+
+def configure_genai(api_key: Optional[str] = None) -> bool:
+    """Gemini API 설정 (이미 설정된 경우 다시 설정하지 않음)."""
+    global _GENAI_API_KEY
+    
+    if not import_genai():
         print("Gemini API를 사용하려면 google-generativeai 패키지를 설치하세요: pip install google-generativeai")
         return False
     
+    if _GENAI_API_KEY is not None and api_key in (None, _GENAI_API_KEY):
+        return True
+    
     # .env 파일 로드 시도
     if dotenv_loaded:
         load_env_file()
@@ -69,9 +140,28 @@ def configure_genai(api_key: Optional[str] = None) -> bool:
     
     # Gemini API 설정
     genai.configure(api_key=api_key)
+    _GENAI_API_KEY = api_key
     return True
 
 
+def create_model(model_name: str = MODEL_NAME, generation_config: Optional[Dict[str, Any]] = None) -> Any:
+    """번역에 사용할 Gemini 모델 반환 (설정별로 한 번만 생성)."""
+    if generation_config is None:
+        generation_config = GENERATION_CONFIG
+    
+    cache_key = (model_name, tuple(sorted(generation_config.items())))
+    model = _MODEL_CACHE.get(cache_key)
+    if model is None:
+        model = genai.GenerativeModel(
+            model_name=model_name,
+            generation_config=generation_config,
+            safety_settings=get_safety_settings()
+        )
+        _MODEL_CACHE[cache_key] = model
+    
+    return model
+
+
 def translate_text(text: str, source_lang: str = "en", target_lang: str = "ko", api_key: Optional[str] = None) -> str:
     """Gemini API를 사용하여 텍스트 번역."""
     if not configure_genai(api_key):
@@ -95,25 +185,7 @@ Translation:
     
     # Gemini 모델 설정
     try:
-        generation_config = {
-            "temperature": 0.2,
-            "top_p": 0.8,
-            "top_k": 40,
-            "max_output_tokens": 8192,
-        }
-        
-        safety_settings = {
-            HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-        }
-        
-        model = genai.GenerativeModel(
-            model_name="gemini-1.5-pro",
-            generation_config=generation_config,
-            safety_settings=safety_settings
-        )
+        model = create_model()
         
         # 응답 생성
         response = model.generate_content(prompt)
@@ -127,7 +199,7 @@ Translation:
         try:
             print(f"번역 중 오류 발생: {str(e)}. 5초 후 재시도합니다...")
             time.sleep(5)
-            model = genai.GenerativeModel(model_name="gemini-1.5-pro")
+            model = genai.GenerativeModel(model_name=MODEL_NAME)
             response = model.generate_content(prompt)
             translated_text = response.text
             return translated_text.strip()
@@ -135,26 +207,96 @@ Translation:
             raise TranslationError(f"번역 중 오류 발생: {str(e)}")
 
 
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수를 대략적으로 추정 (약 4자당 1토큰)."""
+    return len(text) // 4 + 1
+
+
+def split_into_batches(items: List[Tuple[int, str]], token_budget: int = BATCH_TOKEN_BUDGET) -> List[List[Tuple[int, str]]]:
+    """(인덱스, 단락) 목록을 토큰 예산 단위의 묶음으로 분할."""
+    batches = []
+    current_batch = []
+    current_tokens = 0
+    for index, paragraph in items:
+        tokens = estimate_tokens(paragraph)
+        if current_batch and current_tokens + tokens > token_budget:
+            batches.append(current_batch)
+            current_batch = []
+            current_tokens = 0
+        current_batch.append((index, paragraph))
+        current_tokens += tokens
+    
+    if current_batch:
+        batches.append(current_batch)
+    
+    return batches
+
+
+def translate_batch(model: Any, batch: List[Tuple[int, str]], source_lang: str, target_lang: str) -> Optional[Dict[int, str]]:
+    """단락 묶음을 한 번의 요청으로 번역.
+    
+    응답의 마커가 요청과 일치하지 않으면 None을 반환합니다.
+    """
+    segments = "".join(
+        f"\n\n{SEGMENT_MARKER.format(index=index)}\n{paragraph}" for index, paragraph in batch
+    )
+    prompt = f"""
+Please translate the following text segments from {source_lang} to {target_lang}.
+Each segment begins with a marker line such as {SEGMENT_MARKER.format(index=0)}.
+Copy every marker verbatim on its own line, followed by the translation of that segment only.
+Do not merge, split, reorder, or omit segments, and do not add any other text.
+Maintain the original meaning, tone, and context as closely as possible.
+Ensure the translation is natural and fluent in {target_lang}.
+
+Segments to translate:{segments}
+"""
+    
+    response = model.generate_content(prompt)
+    
+    # 응답을 마커 기준으로 분리: [머리말, 인덱스, 번역, 인덱스, 번역, ...]
+    parts = SEGMENT_PATTERN.split(response.text)
+    indices = [int(index) for index in parts[1::2]]
+    if indices != [index for index, _ in batch]:
+        return None
+    
+    return {index: text.strip() for index, text in zip(indices, parts[2::2])}
+
+
 def translate_paragraphs(paragraphs: list, source_lang: str = "en", target_lang: str = "ko", api_key: Optional[str] = None) -> list:
-    """단락 목록을 번역."""
+    """단락 목록을 번역.
+    
+    단락들을 토큰 예산 단위로 묶어 묶음마다 한 번만 요청하며,
+    응답의 마커가 맞지 않는 묶음만 단락별로 다시 번역합니다.
+    """
     if not configure_genai(api_key):
         raise TranslationError("Gemini API 설정에 실패했습니다.")
     
-    translated_paragraphs = []
+    translated_paragraphs = ["" for _ in paragraphs]
+    items = [(i, paragraph) for i, paragraph in enumerate(paragraphs) if paragraph.strip()]
+    batches = split_into_batches(items)
+    model = create_model()
     
-    for i, paragraph in enumerate(paragraphs):
-        if paragraph.strip():
+    for batch_no, batch in enumerate(batches):
+        print(f"단락 묶음 {batch_no+1}/{len(batches)} 번역 중... ({len(batch)}개 단락)")
+        try:
+            translated = translate_batch(model, batch, source_lang, target_lang)
+        except Exception as e:
+            print(f"단락 묶음 번역 실패: {str(e)}")
+            translated = None
+        
+        if translated is not None:
+            for index, _ in batch:
+                translated_paragraphs[index] = translated[index]
+            continue
+        
+        # 일괄 번역 결과가 맞지 않으면 단락별로 번역
+        print("단락 묶음 응답이 올바르지 않아 단락별로 번역합니다.")
+        for index, paragraph in batch:
             try:
-                print(f"단락 {i+1}/{len(paragraphs)} 번역 중...")
-                translated = translate_text(paragraph, source_lang, target_lang, api_key)
-                translated_paragraphs.append(translated)
-                # API 요청 간 간격 두기
-                time.sleep(1)
+                translated_paragraphs[index] = translate_text(paragraph, source_lang, target_lang, api_key)
             except Exception as e:
                 print(f"단락 번역 실패: {str(e)}")
-                translated_paragraphs.append(paragraph)  # 실패 시 원본 텍스트 사용
-        else:
-            translated_paragraphs.append("")
+                translated_paragraphs[index] = paragraph  # 실패 시 원본 텍스트 사용
     
     return translated_paragraphs
 
@@ -164,37 +306,24 @@ def detect_language(text: str) -> str:
     
     참고: 더 정확한 언어 감지가 필요하면 langdetect 또는 fasttext 등의 전용 라이브러리를 사용하는 것이 좋습니다.
     """
-    # 한국어 문자 범위
-    korean_chars = set([chr(c) for c in range(0xAC00, 0xD7A4)])
-    
-    # 일본어 히라가나, 가타카나 범위
-    japanese_chars = set([chr(c) for c in range(0x3040, 0x30FF)])
-    
-    # 중국어 간체, 번체 범위 (일부)
-    chinese_chars = set([chr(c) for c in range(0x4E00, 0x9FFF)])
-    
-    # 영어 문자
-    english_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
-    
-    # 문자별 카운트
-    korean_count = sum(1 for c in text if c in korean_chars)
-    japanese_count = sum(1 for c in text if c in japanese_chars)
-    chinese_count = sum(1 for c in text if c in chinese_chars)
-    english_count = sum(1 for c in text if c in english_chars)
-    
-    # 가장 많은 문자 타입의 언어 반환
-    counts = {
-        'ko': korean_count,
-        'ja': japanese_count,
-        'zh': chinese_count,
-        'en': english_count
-    }
+    # 문자마다 언어 태그로 변환해 집계 (변환은 C 수준에서 수행)
+    # 일정 길이마다 확인해 한 언어가 확실히 우세하면 나머지는 읽지 않음
+    tag_counts = Counter()
+    scanned = 0
+    for start in range(0, len(text), LANGUAGE_CHUNK_SIZE):
+        chunk = text[start:start + LANGUAGE_CHUNK_SIZE]
+        tag_counts.update(chunk.translate(LANGUAGE_TABLE))
+        scanned += len(chunk)
+        if max(tag_counts[tag] for tag in LANGUAGE_TAGS.values()) > scanned * LANGUAGE_DOMINANCE_RATIO:
+            break
+    
+    counts = {lang: tag_counts[tag] for lang, tag in LANGUAGE_TAGS.items()}
     
     # 언어 코드 반환 (기본값은 영어)
     max_lang = max(counts, key=counts.get)
     
     # 대부분의 문자가 ASCII인 경우 영어로 가정
-    if counts[max_lang] < len(text) * 0.05:
+    if counts[max_lang] < scanned * 0.05:
         return 'en'
     
     return max_lang
\ No newline at end of file